@@ -2,7 +2,7 @@
 Document Summarization Streamlit App
 
 This Streamlit application provides a web interface for summarizing PDF and text documents.
-It uses the BART-large-CNN model for text summarization and supports both PDF and TXT files.
+It uses the DistilBART-CNN model for text summarization and supports both PDF and TXT files.
 
 Key Features:
 - Interactive file upload widget
@@ -17,22 +17,72 @@ Dependencies:
 - streamlit: Web app framework
 - transformers: Hugging Face transformers for summarization
 - pdfplumber: PDF text extraction
+- pypdfium2 (optional): fast PDF text extraction through PDFium
 - torch: PyTorch for model backend
+- ctranslate2 (optional): CTranslate2 int8 inference backend
+- optimum[onnxruntime] (optional): ONNX Runtime inference backend, optimum[onnxruntime-gpu] on CUDA GPUs
+- bitsandbytes (optional): 8-bit model weights on CUDA GPUs
+- intel_extension_for_pytorch (optional): fused BF16 kernels on Intel CPUs
 """
 
 import streamlit as st
-from transformers import pipeline
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, BitsAndBytesConfig, pipeline
+from transformers.utils import is_bitsandbytes_available
 import pdfplumber
+import io
 import os
-import tempfile
-from typing import Optional
+import threading
+from typing import Iterator, List, Optional, Tuple
 import time
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # PDFium extraction is optional, fall back to pdfplumber
+    pdfium = None
+
+try:
+    import intel_extension_for_pytorch as ipex
+except ImportError:  # Intel CPU optimizations are optional, keep stock PyTorch ops
+    ipex = None
+
+try:
+    import ctranslate2
+except ImportError:  # CTranslate2 backend is optional, fall back to PyTorch
+    ctranslate2 = None
+
+try:
+    import onnxruntime
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTOptimizer
+    from optimum.onnxruntime.configuration import OptimizationConfig
+except ImportError:  # ONNX Runtime backend is optional, fall back to PyTorch
+    ORTModelForSeq2SeqLM = None
+
 # Application Configuration
-MAX_TEXT_LENGTH = 1024  # Maximum number of characters to process
+SUMMARIZATION_BACKEND = "onnx"  # 'onnx', 'ctranslate2' or 'torch', unavailable backends fall back to 'torch'
+MODEL_NAME = "sshleifer/distilbart-cnn-12-6"  # Default Hugging Face summarization model
+AVAILABLE_MODELS = [  # Summarization models selectable in the sidebar
+    "sshleifer/distilbart-cnn-12-6",
+    "sshleifer/distilbart-cnn-6-6",
+    "facebook/bart-large-cnn",
+]
+MAX_EXTRACTED_CHARS = 16384  # Characters read from the document, the model input is then truncated to its token limit
 MAX_SUMMARY_LENGTH = 130  # Maximum length of generated summary
 MIN_SUMMARY_LENGTH = 30  # Minimum length of generated summary
 ALLOWED_EXTENSIONS = {'pdf', 'txt'}  # Supported file types
+TEXT_READ_BLOCK_SIZE = 8192  # Characters read per block from text files
+CTRANSLATE2_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "document-summarizer", "ctranslate2")  # Converted CTranslate2 models
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "document-summarizer", "onnx")  # Exported ONNX models
+ONNX_FILE_NAMES = {  # Graph-optimized ONNX files written by ORTOptimizer
+    'encoder_file_name': "encoder_model_optimized.onnx",
+    'decoder_file_name': "decoder_model_optimized.onnx",
+    'decoder_with_past_file_name': "decoder_with_past_model_optimized.onnx",
+}
+ONNX_INT8_DECODER_FILE_NAMES = {  # Decoders dynamically quantized to INT8 for CPU inference
+    'decoder_file_name': "decoder_model_int8.onnx",
+    'decoder_with_past_file_name': "decoder_with_past_model_int8.onnx",
+}
 
 # Configure Streamlit page
 st.set_page_config(
@@ -42,72 +92,440 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-@st.cache_resource
-def load_summarization_model():
+class CTranslate2Model:
+    """
+    Seq2seq model stand-in backed by a CTranslate2 Translator.
+    
+    Implements the subset of the transformers generate() interface used by this
+    app and returns summary token ids, so its output is decoded like any other model.
+    """
+    
+    def __init__(self, translator, tokenizer):
+        self.translator = translator
+        self.tokenizer = tokenizer
+        self.device = torch.device('cpu')  # Inputs are handed to CTranslate2 as token strings
+    
+    def generate(self, input_ids, max_length: int, min_length: int, num_beams: int = 1,
+                 no_repeat_ngram_size: int = 0, **generate_kwargs) -> List[List[int]]:
+        """
+        Generate summaries with the CTranslate2 decoder.
+        
+        Args:
+            input_ids: Batch of input token ids
+            max_length (int): Maximum summary length in tokens
+            min_length (int): Minimum summary length in tokens
+            num_beams (int): Beam size, 1 for greedy decoding
+            no_repeat_ngram_size (int): Size of n-grams that may not repeat, 0 to disable
+            **generate_kwargs: Options without a CTranslate2 equivalent (attention_mask, do_sample, use_cache), ignored
+            
+        Returns:
+            List[List[int]]: Summary token ids for each input
+        """
+        results = self.translator.translate_batch(
+            [self.tokenizer.convert_ids_to_tokens(ids) for ids in input_ids.tolist()],
+            max_decoding_length=max_length,
+            min_decoding_length=min_length,
+            beam_size=num_beams,
+            no_repeat_ngram_size=no_repeat_ngram_size
+        )
+        return [self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]) for result in results]
+
+class CTranslate2Summarizer:
+    """
+    Summarization pipeline stand-in pairing a CTranslate2Model with its tokenizer.
+    """
+    
+    def __init__(self, translator, tokenizer):
+        self.model = CTranslate2Model(translator, tokenizer)
+        self.tokenizer = tokenizer
+
+def load_ctranslate2_summarizer(model_name: str) -> CTranslate2Summarizer:
+    """
+    Build a summarizer served by CTranslate2 with int8 weights.
+    
+    The model is converted once with int8 quantization and stored in
+    CTRANSLATE2_CACHE_DIR for subsequent starts. On a CUDA GPU the int8
+    weights are combined with FP16 activations.
+    
+    Args:
+        model_name (str): Hugging Face model identifier
+        
+    Returns:
+        CTranslate2Summarizer: Summarizer wrapping a ctranslate2.Translator
+    """
+    save_dir = os.path.join(CTRANSLATE2_CACHE_DIR, model_name.replace('/', '--'))
+    if not os.path.exists(os.path.join(save_dir, "model.bin")):
+        ctranslate2.converters.TransformersConverter(model_name).convert(save_dir, quantization="int8", force=True)
+    
+    if ctranslate2.get_cuda_device_count() > 0:
+        translator = ctranslate2.Translator(save_dir, device="cuda", compute_type="int8_float16")
+    else:
+        translator = ctranslate2.Translator(save_dir, device="cpu", compute_type="int8")
+    return CTranslate2Summarizer(translator, AutoTokenizer.from_pretrained(model_name))
+
+def load_onnx_pipeline(model_name: str):
+    """
+    Build a summarization pipeline served by ONNX Runtime.
+    
+    The model is exported once (encoder, decoder and decoder-with-past, so the
+    KV cache is reused during generation), graph-optimized and stored in
+    ONNX_CACHE_DIR for subsequent starts. On CPU all ONNX Runtime fusions are
+    applied and the memory-bound decoders are dynamically quantized to INT8,
+    while the encoder, which runs once per summary, keeps its FP32 weights. On a
+    CUDA GPU (with onnxruntime-gpu) the graph is converted to FP16 and served by
+    the CUDA execution provider.
+    
+    Args:
+        model_name (str): Hugging Face model identifier
+        
+    Returns:
+        pipeline: Summarization pipeline wrapping an ORTModelForSeq2SeqLM
+    """
+    use_cuda = torch.cuda.is_available() and 'CUDAExecutionProvider' in onnxruntime.get_available_providers()
+    provider = "CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider"
+    save_dir = os.path.join(ONNX_CACHE_DIR, model_name.replace('/', '--') + ("-cuda-fp16" if use_cuda else ""))
+    
+    if not all(os.path.exists(os.path.join(save_dir, file_name)) for file_name in ONNX_FILE_NAMES.values()):
+        ort_model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, use_cache=True, provider=provider)
+        if use_cuda:
+            # Hardware-specific layout optimizations (level 99) are CPU-only
+            optimization_config = OptimizationConfig(optimization_level=2, optimize_for_gpu=True, fp16=True)
+        else:
+            # FP16 conversion is only supported for GPU-optimized graphs, keep FP32 on CPU
+            optimization_config = OptimizationConfig(optimization_level=99, optimize_for_gpu=False, fp16=False)
+        ORTOptimizer.from_pretrained(ort_model).optimize(save_dir=save_dir, optimization_config=optimization_config)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(save_dir)
+    
+    file_names = ONNX_FILE_NAMES
+    if not use_cuda:
+        # INT8 GEMMs run on CPU only (VNNI on x86), the CUDA provider keeps FP16 decoders
+        file_names = {**ONNX_FILE_NAMES, **ONNX_INT8_DECODER_FILE_NAMES}
+        for file_key, int8_file_name in ONNX_INT8_DECODER_FILE_NAMES.items():
+            int8_file_path = os.path.join(save_dir, int8_file_name)
+            if not os.path.exists(int8_file_path):
+                quantize_dynamic(os.path.join(save_dir, ONNX_FILE_NAMES[file_key]), int8_file_path, weight_type=QuantType.QInt8)
+    
+    ort_model = ORTModelForSeq2SeqLM.from_pretrained(save_dir, use_cache=True, provider=provider, **file_names)
+    return pipeline("summarization", model=ort_model, tokenizer=AutoTokenizer.from_pretrained(save_dir))
+
+def cpu_supports_bf16() -> bool:
+    """
+    Check whether the CPU has native BF16 matmul instructions.
+    
+    oneDNN also runs BF16 on plain AVX-512 CPUs (e.g. Skylake, Cascade Lake) by
+    emulating it, which is slower than FP32, so only the instruction sets are checked.
+    
+    Returns:
+        bool: True on CPUs with AVX-512 BF16 or AMX tiles, False otherwise (or when
+            this torch build cannot report them)
+    """
+    # Private, version-dependent torch helpers, the AMX check is newer than the AVX-512 one
+    cpu_capabilities = getattr(torch._C, '_cpu', None)
+    capability_checks = [
+        getattr(cpu_capabilities, '_is_avx512_bf16_supported', None),
+        getattr(cpu_capabilities, '_is_amx_tile_supported', None),
+    ]
+    return any(check() for check in capability_checks if check is not None)
+
+def inference_autocast(summarizer):
+    """
+    Build the autocast context used around summarizer calls.
+    
+    FP32 PyTorch models on CPUs with native BF16 support run under BF16
+    autocast; CTranslate2, ONNX Runtime, GPU and INT8 models are left untouched.
+    
+    Args:
+        summarizer: Summarizer returned by load_summarization_model
+        
+    Returns:
+        torch.autocast: Autocast context, disabled when BF16 does not apply
+    """
+    use_bf16 = (
+        isinstance(summarizer.model, torch.nn.Module)
+        and summarizer.model.device.type == 'cpu'
+        and cpu_supports_bf16()
+    )
+    return torch.autocast(device_type='cpu', dtype=torch.bfloat16, enabled=use_bf16)
+
+def generate_summary(summarizer, text: str, max_length: int, min_length: int) -> Tuple[str, str, Optional[int]]:
+    """
+    Summarize a text with greedy decoding.
+    
+    The text is tokenized once and truncated to the model's token limit, and
+    the token ids are passed straight to the model's generate().
+    
+    Args:
+        summarizer: Summarizer returned by load_summarization_model
+        text (str): Text to summarize
+        max_length (int): Maximum summary length
+        min_length (int): Minimum summary length
+        
+    Returns:
+        Tuple[str, str, Optional[int]]: Generated summary, the input text the model
+            received, and the token count it was truncated to (None if it fit)
+    """
+    tokenizer = summarizer.tokenizer
+    encoding = tokenizer(text, truncation=True, max_length=tokenizer.model_max_length, return_overflowing_tokens=True)
+    # Fast tokenizers return the cut-off tokens as extra windows after the first one
+    input_ids = encoding['input_ids'][0]
+    truncated = len(encoding['input_ids']) > 1
+    
+    # Greedy decoding, BART defaults to 4 beams
+    with torch.inference_mode(), inference_autocast(summarizer):
+        summary_ids = summarizer.model.generate(
+            input_ids=torch.tensor([input_ids], device=summarizer.model.device),
+            attention_mask=torch.tensor([encoding['attention_mask'][0]], device=summarizer.model.device),
+            max_length=max_length,
+            min_length=min_length,
+            do_sample=False,
+            num_beams=1,
+            use_cache=True,
+            no_repeat_ngram_size=3
+        )
+    return (
+        tokenizer.batch_decode(summary_ids, skip_special_tokens=True)[0],
+        tokenizer.decode(input_ids, skip_special_tokens=True),
+        len(input_ids) if truncated else None
+    )
+
+def load_torch_pipeline(model_name: str):
+    """
+    Build a summarization pipeline served by PyTorch.
+    
+    On a CUDA GPU the weights are loaded in 8-bit with bitsandbytes (LLM.int8()),
+    or in FP16 when bitsandbytes is not installed. CPUs with native BF16 support
+    run under BF16 autocast (see inference_autocast), with BF16 weights and
+    fused operators from Intel Extension for PyTorch when it is installed; on other
+    CPUs the Linear layers are dynamically quantized to INT8, which quarters the
+    weight traffic of the memory-bound decoder compared to FP32. The forward
+    pass used by every decoding step is compiled with torch.compile (CUDA graphs
+    over a static KV cache on GPU) and warmed up once, unless the weights are
+    8-bit or optimized by IPEX.
+    
+    Args:
+        model_name (str): Hugging Face model identifier
+        
+    Returns:
+        pipeline: Summarization pipeline wrapping the quantized model
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    # Route attention through PyTorch's fused scaled_dot_product_attention kernels
+    model_kwargs = {'attn_implementation': "sdpa", 'low_cpu_mem_usage': True}
+    compile_model = True
+    
+    if torch.cuda.is_available():
+        if is_bitsandbytes_available():
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name, device_map="auto", quantization_config=BitsAndBytesConfig(load_in_8bit=True), **model_kwargs
+            )
+            compile_model = False
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name, device_map="auto", torch_dtype=torch.float16, **model_kwargs
+            )
+    else:
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name, **model_kwargs).eval()
+        if cpu_supports_bf16():
+            if ipex is not None:
+                # ipex.llm.optimize only covers a fixed list of LLM architectures, not BART
+                model = ipex.optimize(model, dtype=torch.bfloat16)
+                compile_model = False
+        else:
+            if 'fbgemm' in torch.backends.quantized.supported_engines:
+                torch.backends.quantized.engine = 'fbgemm'  # x86 AVX2/VNNI int8 GEMM kernels
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            compile_model = False  # Dynamo breaks the graph at every packed quantized Linear
+    
+    model.config.use_cache = True
+    if compile_model:
+        # generate() calls model.forward directly, so compile the bound method rather than the module
+        if model.device.type == 'cuda':
+            # CUDA graphs need a static KV cache; its size follows max_length, so graphs
+            # are still recorded once per new input or summary length
+            model.generation_config.cache_implementation = "static"
+            model.forward = torch.compile(model.forward, mode="reduce-overhead", dynamic=True)
+        else:
+            model.forward = torch.compile(model.forward, dynamic=True)
+    
+    summarizer = pipeline("summarization", model=model, tokenizer=tokenizer)
+    if compile_model:
+        # Warm up with a full-length input so Dynamo compiles at load time rather than on the first click
+        warmup_text = " ".join(["warm-up"] * tokenizer.model_max_length)
+        generate_summary(summarizer, warmup_text, MAX_SUMMARY_LENGTH, MIN_SUMMARY_LENGTH)
+    return summarizer
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_summarization_model(model_name: str = MODEL_NAME):
     """
     Load and cache the summarization model to avoid reloading on every interaction.
     
+    At most two models are kept in memory, the least recently used one is evicted.
+    Runs without Streamlit elements so it can also be called from the preload thread.
+    
+    Uses the backend selected by SUMMARIZATION_BACKEND when its package is
+    installed and the PyTorch pipeline otherwise. When a CUDA GPU is available
+    every backend runs on it with FP16 (or 8-bit) weights; on GPU machines with
+    the CPU-only onnxruntime package the 'onnx' backend falls back to PyTorch.
+    
+    Args:
+        model_name (str): Hugging Face model identifier
+        
     Returns:
-        pipeline: Initialized summarization pipeline
+        pipeline: Initialized summarization pipeline (or CTranslate2Summarizer)
     """
-    with st.spinner("Loading summarization model... This may take a moment."):
-        return pipeline("summarization", model="facebook/bart-large-cnn")
+    if SUMMARIZATION_BACKEND == 'ctranslate2' and ctranslate2 is not None:
+        summarizer = load_ctranslate2_summarizer(model_name)
+    elif SUMMARIZATION_BACKEND == 'onnx' and ORTModelForSeq2SeqLM is not None and (
+        not torch.cuda.is_available() or 'CUDAExecutionProvider' in onnxruntime.get_available_providers()
+    ):
+        summarizer = load_onnx_pipeline(model_name)
+    else:
+        summarizer = load_torch_pipeline(model_name)
+    return summarizer
 
-def is_valid_file_extension(filename: str) -> bool:
+@st.cache_resource(show_spinner=False)
+def start_model_preload() -> threading.Thread:
     """
-    Validate if the uploaded file has an allowed extension.
+    Start loading the default summarization model in a background thread.
+    
+    Cached, so the thread is started once per server process rather than on
+    every rerun, and the default model is usually ready before the first click.
+    Other models are only loaded when a summary is requested with them.
+    
+    Returns:
+        threading.Thread: The started preload thread
+    """
+    preload_thread = threading.Thread(target=load_summarization_model, args=(MODEL_NAME,), daemon=True)
+    preload_thread.start()
+    return preload_thread
+
+def get_file_extension(filename: str) -> Optional[str]:
+    """
+    Parse and validate the extension of the uploaded file.
     
     Args:
         filename (str): Name of the uploaded file
         
     Returns:
-        bool: True if file extension is allowed, False otherwise
+        Optional[str]: Lowercase extension without the dot, or None if it is not allowed
     """
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    file_extension = os.path.splitext(filename)[1].lstrip('.').lower()
+    return file_extension if file_extension in ALLOWED_EXTENSIONS else None
 
-def extract_text_from_file(file_path: str, file_extension: str) -> Optional[str]:
+def iter_text_from_file(file_bytes: bytes, file_extension: str) -> Iterator[str]:
+    """
+    Stream text content from the uploaded file piece by piece.
+    
+    PDF files are read one page at a time and text files one block at a time,
+    so callers can stop reading as soon as they have enough text. PDFs are read
+    with PDFium when pypdfium2 is installed, falling back to pdfplumber when it
+    finds no text.
+    
+    Args:
+        file_bytes (bytes): Raw content of the uploaded file
+        file_extension (str): Extension of the file ('pdf' or 'txt')
+        
+    Yields:
+        str: Next piece of text, to be concatenated as-is
+    """
+    if file_extension == 'pdf':
+        if pdfium is not None:
+            # Handle PDF files using PDFium, pages are separated by spaces
+            pdf_document = pdfium.PdfDocument(file_bytes)
+            try:
+                found_text = False
+                for page in pdf_document:
+                    text_page = page.get_textpage()
+                    page_text = text_page.get_text_range()
+                    text_page.close()
+                    page.close()
+                    found_text = found_text or bool(page_text.strip())
+                    yield page_text + " "
+            finally:
+                pdf_document.close()
+            if found_text:
+                return
+        
+        # Handle PDF files using pdfplumber, pages are separated by spaces
+        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf_document:
+            for page in pdf_document.pages:
+                yield (page.extract_text() or "") + " "
+    else:  # txt file
+        # Handle plain text files
+        with io.TextIOWrapper(io.BytesIO(file_bytes), encoding='utf-8') as text_file:
+            yield from iter(lambda: text_file.read(TEXT_READ_BLOCK_SIZE), '')
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def extract_text_from_file(file_bytes: bytes, file_extension: str, max_chars: Optional[int] = None) -> Optional[str]:
     """
     Extract text content from the uploaded file based on its type.
     
+    Results are cached by file content, so re-uploading the same file skips extraction.
+    
     Args:
-        file_path (str): Path to the temporary stored file
+        file_bytes (bytes): Raw content of the uploaded file
         file_extension (str): Extension of the file ('pdf' or 'txt')
+        max_chars (Optional[int]): Stop reading once this many characters were collected
         
     Returns:
         Optional[str]: Extracted text content or None if extraction fails
     """
     try:
-        if file_extension == 'pdf':
-            # Handle PDF files using pdfplumber
-            with pdfplumber.open(file_path) as pdf_document:
-                # Extract text from each page and join with spaces
-                return " ".join(page.extract_text() or "" for page in pdf_document.pages).strip()
-        else:  # txt file
-            # Handle plain text files
-            with open(file_path, 'r', encoding='utf-8') as text_file:
-                return text_file.read().strip()
+        text_buffer = io.StringIO()
+        char_count = 0
+        for text_piece in iter_text_from_file(file_bytes, file_extension):
+            text_buffer.write(text_piece)
+            char_count += len(text_piece)
+            if max_chars is not None and char_count >= max_chars:
+                break
+        return text_buffer.getvalue().strip()
     except Exception as error:
         st.error(f"Error extracting text: {str(error)}")
         return None
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def summarize_text(text: str, model_name: str, max_length: int, min_length: int) -> Tuple[str, str, Optional[int]]:
+    """
+    Generate and cache the summary of a text.
+    
+    The model is loaded here rather than by the caller, so cached summaries are
+    returned without loading it.
+    
+    Args:
+        text (str): Text to summarize
+        model_name (str): Hugging Face model identifier
+        max_length (int): Maximum summary length
+        min_length (int): Minimum summary length
+        
+    Returns:
+        Tuple[str, str, Optional[int]]: Generated summary, the input text the model
+            received, and the token count it was truncated to (None if it fit)
+    """
+    return generate_summary(load_summarization_model(model_name), text, max_length, min_length)
+
 def main():
     """Main Streamlit application function"""
     
+    start_model_preload()
+    
     # App header
     st.title("📄 Document Summarizer")
-    st.markdown("Upload a PDF or text document to get an AI-generated summary using BART-large-CNN model.")
+    st.markdown("Upload a PDF or text document to get an AI-generated summary using a BART summarization model.")
     
     # Sidebar configuration
     with st.sidebar:
         st.header("⚙️ Configuration")
         
+        # Model selection
+        model_name = st.selectbox("Summarization Model", AVAILABLE_MODELS, index=AVAILABLE_MODELS.index(MODEL_NAME))
+        
         # Model information
-        st.info("""
-        **Model**: facebook/bart-large-cnn
+        st.info(f"""
+        **Model**: {model_name}
         
         **Supported formats**: PDF, TXT
         
-        **Max text length**: 1,024 characters
+        **Max text length**: 1,024 tokens
         """)
         
         # Advanced settings
@@ -119,7 +537,7 @@ def main():
         if 'stats' in st.session_state:
             st.subheader("📊 Statistics")
             stats = st.session_state.stats
-            st.metric("Original Length", f"{stats['original_length']} chars")
+            st.metric("Input Length", f"{stats['input_length']} chars")
             st.metric("Summary Length", f"{stats['summary_length']} chars")
             st.metric("Compression Ratio", f"{stats['compression_ratio']:.1%}")
     
@@ -133,7 +551,7 @@ def main():
         uploaded_file = st.file_uploader(
             "Choose a PDF or TXT file",
             type=['pdf', 'txt'],
-            help="Upload a document to summarize. Maximum text length processed: 1,024 characters."
+            help="Upload a document to summarize. Maximum text length processed: 1,024 tokens."
         )
         
         if uploaded_file is not None:
@@ -143,7 +561,7 @@ def main():
             
             # Process button
             if st.button("🚀 Generate Summary", type="primary"):
-                process_document(uploaded_file, custom_max_length, custom_min_length)
+                process_document(uploaded_file, custom_max_length, custom_min_length, model_name)
     
     with col2:
         st.subheader("📋 Results")
@@ -176,7 +594,7 @@ def main():
         else:
             st.info("👆 Upload a document and click 'Generate Summary' to see results here.")
 
-def process_document(uploaded_file, max_length: int, min_length: int):
+def process_document(uploaded_file, max_length: int, min_length: int, model_name: str = MODEL_NAME):
     """
     Process the uploaded document and generate summary.
     
@@ -184,10 +602,12 @@ def process_document(uploaded_file, max_length: int, min_length: int):
         uploaded_file: Streamlit UploadedFile object
         max_length (int): Maximum summary length
         min_length (int): Minimum summary length
+        model_name (str): Hugging Face model identifier
     """
     try:
         # Validate file extension
-        if not is_valid_file_extension(uploaded_file.name):
+        file_extension = get_file_extension(uploaded_file.name)
+        if file_extension is None:
             st.error(f"❌ Unsupported file type. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}")
             return
         
@@ -195,83 +615,56 @@ def process_document(uploaded_file, max_length: int, min_length: int):
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        # Step 1: Save uploaded file temporarily
-        status_text.text("📁 Saving file...")
-        progress_bar.progress(20)
+        # Step 1: Extract text
+        status_text.text("🔍 Extracting text...")
+        progress_bar.progress(30)
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
+        extracted_text = extract_text_from_file(uploaded_file.getvalue(), file_extension, MAX_EXTRACTED_CHARS)
         
-        try:
-            # Step 2: Extract text
-            status_text.text("🔍 Extracting text...")
-            progress_bar.progress(40)
-            
-            file_extension = uploaded_file.name.rsplit('.', 1)[1].lower()
-            extracted_text = extract_text_from_file(tmp_file_path, file_extension)
-            
-            if not extracted_text:
-                st.error("❌ No text could be extracted from the file")
-                return
-            
-            # Step 3: Truncate text if necessary
-            original_length = len(extracted_text)
-            if len(extracted_text) > MAX_TEXT_LENGTH:
-                extracted_text = extracted_text[:MAX_TEXT_LENGTH]
-                st.warning(f"⚠️ Text truncated to {MAX_TEXT_LENGTH} characters for processing")
-            
-            # Step 4: Load model and generate summary
-            status_text.text("🤖 Loading AI model...")
-            progress_bar.progress(60)
-            
-            summarizer = load_summarization_model()
-            
-            status_text.text("✨ Generating summary...")
-            progress_bar.progress(80)
-            
-            # Generate summary
-            summary_result = summarizer(
-                extracted_text,
-                max_length=max_length,
-                min_length=min_length,
-                do_sample=False
-            )[0]['summary_text']
-            
-            # Step 5: Store results
-            progress_bar.progress(100)
-            status_text.text("✅ Summary generated successfully!")
-            
-            # Calculate statistics
-            summary_length = len(summary_result)
-            compression_ratio = 1 - (summary_length / original_length)
-            
-            # Store in session state
-            st.session_state.summary_result = {
-                'summary': summary_result,
-                'original_text': extracted_text,
-                'original_length': original_length,
-                'summary_length': summary_length
-            }
-            
-            st.session_state.stats = {
-                'original_length': original_length,
-                'summary_length': summary_length,
-                'compression_ratio': compression_ratio
-            }
-            
-            # Clear progress indicators
-            time.sleep(1)
-            progress_bar.empty()
-            status_text.empty()
-            
-            # Success message
-            st.success(f"🎉 Summary generated successfully! Compressed from {original_length} to {summary_length} characters.")
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
+        if not extracted_text:
+            st.error("❌ No text could be extracted from the file")
+            return
+        
+        # Step 2: Generate summary, the model is only loaded when the summary is not cached
+        status_text.text("✨ Generating summary...")
+        progress_bar.progress(60)
+        
+        # The tokenizer truncates the input to the model's token limit
+        with st.spinner("Generating summary... Loading the model may take a moment."):
+            summary_result, input_text, truncated_tokens = summarize_text(extracted_text, model_name, max_length, min_length)
+        if truncated_tokens is not None:
+            st.warning(f"⚠️ Text truncated to {truncated_tokens} tokens for processing")
+        
+        # Step 3: Store results
+        progress_bar.progress(100)
+        status_text.text("✅ Summary generated successfully!")
+        
+        # Calculate statistics on the text the model actually summarized
+        input_length = len(input_text)
+        summary_length = len(summary_result)
+        compression_ratio = 1 - (summary_length / input_length)
+        
+        # Store in session state
+        st.session_state.summary_result = {
+            'summary': summary_result,
+            'original_text': input_text,
+            'input_length': input_length,
+            'summary_length': summary_length
+        }
+        
+        st.session_state.stats = {
+            'input_length': input_length,
+            'summary_length': summary_length,
+            'compression_ratio': compression_ratio
+        }
+        
+        # Clear progress indicators
+        time.sleep(1)
+        progress_bar.empty()
+        status_text.empty()
+        
+        # Success message
+        st.success(f"🎉 Summary generated successfully! Compressed from {input_length} to {summary_length} characters.")
     
     except Exception as error:
         st.error(f"❌ An error occurred while processing the file: {str(error)}")